@@ -18,70 +18,142 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-import os
-import sys
-import json
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from multiprocessing import Pool
+from pathlib import Path
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 from matplotlib.backends.backend_pdf import PdfPages
 
+# Use the fastest JSON parser available: orjson, then ujson, then stdlib.
+try:
+    from orjson import loads
+except ImportError:
+    try:
+        from ujson import loads
+    except ImportError:
+        import json
+
+        def loads(data):
+            return json.loads(data.decode('utf-8'))
+
+# Evaluate the VSWR in one fused pass with numexpr when it is installed.
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Render the pages in parallel and merge them with pypdf 4.3 or later when it
+# is installed.  Older versions cannot share the fonts between the pages.
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    PdfWriter = None
+if not hasattr(PdfWriter, 'compress_identical_objects'):
+    PdfWriter = None
+
 # Get script path.
-if sys.platform == 'win32':
-    script_path = os.path.abspath(__name__).rpartition('\\')[0]+'\\'
-else:
-    script_path = os.path.abspath(__file__).rpartition('/')[0]+'/'
+SCRIPT_DIR = Path(__file__).resolve().parent
 
 # The output will be a multipage PDF document:
-pdf_pages = PdfPages(script_path + 'canadian_band_plan.pdf')
+output = SCRIPT_DIR / 'canadian_band_plan.pdf'
 title = 'Canadian Band Plan with VSWR  (v.2026.12.24)'
 
 
 #### Import SWR Data from Rig Expert .asd files ####
-# Make a list of the .asd files in current folder and sort them by name.
-files = []
-for file in os.listdir(script_path):
-    if file.endswith(".asd"):
-        files.append(file)
-files.sort()
-
-# Read asd files and create lists of frequencies, resistance and reactance:
-freq = []
-resistance = []
-reactance = []
-for file in files:
-    with open(script_path + file, "r", encoding="utf-8") as raw_file:
-        raw = json.load(raw_file)
-    size = len(raw['Measurements'])
-    freq = [raw['Measurements'][i]['fq'] for i in range(0, size)] + freq
-    resistance = [raw['Measurements'][i]['r'] for i in range(0, size)] \
-        + resistance
-    reactance = [raw['Measurements'][i]['x'] for i in range(0, size)] \
-        + reactance
-
-# Convert lists to Numpy arrays
-freq = np.array(freq, dtype=float)
-resistance = np.array(resistance, dtype=float)
-reactance = np.array(reactance, dtype=float)
-
-# Two steps to calculate the VSWR from the resistance and reactance:
-# 1) rho = sqrt( ((R - 50)^2 + X^2)/(R + 50)^2 + X^2))
-rho = np.sqrt(np.divide(np.square(resistance - 50) + np.square(reactance),
-                        np.square(resistance + 50) + np.square(reactance)))
-
-# 2) VSWR = (1 + rho) / (1 - rho)
-VSWR = np.divide(1 + rho, 1 - rho)
-
-# Sort the frequencies and VSWR by frequencies
-VSWR = VSWR[np.argsort(freq)]
-freq = freq[np.argsort(freq)]
-
-# Create Horizontal lines at 1, 3, and 10
-VSWR1 = len(freq)*[1]     # y = 1
-VSWR3 = len(freq)*[3]     # y = 3
-VSWR10 = len(freq)*[10]   # y = 10
-
-# Common Graphing Parameters
+def load_asd(path):
+    '''Return a (size, 3) array of the frequency, resistance and reactance
+    measured in the asd file at path.'''
+    raw = loads(path.read_bytes())
+    # reshape keeps a file without measurements as (0, 3), not (0,).
+    return np.array([(m['fq'], m['r'], m['x'])
+                     for m in raw['Measurements']],
+                    dtype=np.float64).reshape(-1, 3)
+
+
+def read_vswr(files):
+    '''Return a (N, 2) float32 array of the frequencies and VSWR measured
+    in the asd files, sorted by frequency.'''
+    # Read the asd files in parallel.  map() returns them in the same order.
+    with ThreadPoolExecutor() as executor:
+        chunks = list(executor.map(load_asd, files))
+
+    # Stack the files and split the columns into Numpy arrays
+    all_data = np.concatenate(chunks, axis=0) if chunks else np.empty((0, 3))
+    freq, resistance, reactance = all_data.T.copy()
+
+    # Calculate the VSWR from the resistance and reactance:
+    # 1) rho = sqrt( ((R - 50)^2 + X^2) / ((R + 50)^2 + X^2) )
+    # 2) VSWR = (1 + rho) / (1 - rho)
+    if numexpr is not None:
+        rho = numexpr.evaluate(
+            'sqrt(((R - 50)**2 + X**2) / ((R + 50)**2 + X**2))',
+            local_dict={'R': resistance, 'X': reactance})
+        VSWR = numexpr.evaluate('(1 + rho) / (1 - rho)',
+                                local_dict={'rho': rho})
+    else:
+        rho = np.sqrt(((resistance - 50)**2 + reactance**2)
+                      / ((resistance + 50)**2 + reactance**2))
+        VSWR = (1 + rho) / (1 - rho)
+
+    # Sort the frequencies and VSWR by frequencies
+    # Each file is already sorted, so a stable (merge) sort is cheap here.
+    order = np.argsort(freq, kind='stable')
+
+    # Frequencies and VSWR are always plotted together, so keep them side by
+    # side in one float32 array.  7 significant digits are plenty to draw
+    # frequencies in MHz.
+    xy = np.empty((freq.size, 2), dtype=np.float32)
+    xy[:, 0] = freq[order]
+    xy[:, 1] = VSWR[order]
+    return xy
+
+
+def visible(xy, lo, hi):
+    '''Return the frequencies and VSWR of xy from index lo to hi, plus one
+    point on either side so the curve reaches the edges of the graph.'''
+    rows = xy[max(lo - 1, 0):hi + 1]
+    return rows[:, 0], rows[:, 1]
+
+
+def band(xy, left, right):
+    '''Return the frequencies and VSWR of xy that are visible between left
+    and right.'''
+    return visible(xy, *np.searchsorted(xy[:, 0], [left, right]))
+
+
+#### Common Graphing Parameters ####
+def skip_helvetica_weight(record):
+    '''Logging filter dropping the "Failed to find font weight normal for
+    Helvetica" warning.  The core Helvetica is registered as 'medium', so
+    every label would log it, harmlessly.'''
+    return ('Failed to find font weight normal for Helvetica'
+            not in record.getMessage())
+
+
+def setup_graphs():
+    '''Set the Matplotlib parameters shared by all the pages.  Called by
+    each process that draws them, so importing this module changes
+    nothing.'''
+    matplotlib.use('Agg')   # Only write the PDF: no need for a GUI backend.
+    # Drop vertices closer than a pixel to the line through their neighbours.
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 0.5
+    # Use the standard 14 PDF fonts, which readers already have, for the
+    # labels and embed subsets of any other glyphs (e.g. mathtext) as
+    # TrueType.
+    plt.rcParams['pdf.fonttype'] = 42
+    plt.rcParams['pdf.use14corefonts'] = True
+    # addFilter() ignores a filter that is already installed.
+    logging.getLogger('matplotlib.font_manager').addFilter(
+        skip_helvetica_weight)
+
+
 # Colours:   https://matplotlib.org/3.1.0/gallery/color/named_colors.html
 CW = 'lightsalmon'
 DIGI = 'lightskyblue'
@@ -89,905 +161,567 @@ PHONE = 'limegreen'
 TV = 'plum'
 BEACON = 'mistyrose'
 MISC = 'gold'
+CHANNEL = 'black'       # Channel markers
+GAP = 'white'           # Gaps between sub-bands
+UNALLOCATED = 'grey'
 OVERVIEW = 'black'
 SWRCOLOUR = 'red'
 
+# VSWR curves with more points than this are rasterized at DPI dots per inch
+# to keep the PDF small.  Everything else stays vector.
+RASTER_POINTS = 10000
+DPI = 150
+
 # Vertical coordinates of labels
 label1_y = -0.81    # Lower label
 label2_y = -0.4     # Centre label
 label3_y = 0.1      # Top label
 label4_y = 8.1      # Very top band name
 
+# Vertical coordinates of labels for 2m and 70cm
+vhf_label1_y = 0.73     # Lower label
+vhf_label2_y = 0.79     # Centre label
+vhf_label3_y = 0.88     # Top label
+vhf_label4_y = 1.85     # Very top band name
+
 # Vertical Axis Marks
-y_ticks = [1, 3, 5, 10]
+y_ticks = (1, 3, 5, 10)
+
+
+#### Band Plan ####
+# One entry per graph on the first two pages:
+#   name:    band name printed in the top left corner at height name_y
+#   xlim:    (left, right) edges of the graph
+#   xticks:  frequency labels
+#   rot:     rotation of the frequency labels
+#   prec:    number of decimals of the frequency labels
+#   bars:    (x, width, y, height, colour) of each bar, drawn in order.
+#            Consecutive bars on the same row and in the same colour are
+#            drawn with a single broken_barh call.
+#   labels:  (x, y, text, fontsize) of each label
+BANDS = [
+    {'name': '2200m', 'name_y': label4_y,
+     'xlim': (0.1356, 0.1379),
+     'xticks': [0.1357, 0.1374, 0.1376, 0.1378], 'rot': 20, 'prec': 4,
+     'bars': [(0.1357, 1.1*(0.1374-0.1357), -1, 2, CW),
+              (0.1374, 1.1*(0.1376-0.1374), -1, 2, DIGI),
+              (0.1376, 0.1378-0.1376, -1, 2, MISC)],  # QRSS
+     'labels': [(0.13655, label2_y, 'CW', 7),
+                (0.13747, label2_y, 'Digi', 7),
+                (0.13765, label2_y, 'QRSS', 7)]},
+
+    {'name': '630m', 'name_y': label4_y,
+     'xlim': (0.4716, 0.4794),
+     'xticks': [0.472, 0.475, 0.479], 'rot': 20, 'prec': 3,
+     'bars': [(0.472, 0.479-0.472, -1, 2, CW),
+              (0.475, 0.479-0.475, -1, 1, DIGI)],
+     'labels': [(0.4735, label2_y, 'CW', 7),
+                (0.4768, label2_y, 'Digi', 7)]},
+
+    {'name': '160m', 'name_y': label4_y,
+     'xlim': (1.79, 2.01),
+     'xticks': [1.800, 1.810, 1.840, 2.000], 'rot': 25, 'prec': 3,
+     'bars': [(1.800, 1.1*(1.840-1.800), -1, 2, CW),
+              (1.800, 1.810-1.800, -1, 1, DIGI),
+              (1.840, 2.000-1.840, -1, 2, PHONE)],
+     'labels': [(1.817, label2_y, 'CW', 7),
+                (1.915, label2_y, 'LSB', 7),
+                (1.801, label1_y, 'Digi', 7)]},
+
+    {'name': '80m', 'name_y': label4_y,
+     'xlim': (3.475, 4.025),
+     'xticks': [3.5, 3.58, 3.6, 3.842, 4], 'rot': 30, 'prec': 3,
+     'bars': [(3.5, 3.589-3.5, -1, 2, CW),
+              (3.58, 0.003, -1, 2, DIGI),
+              (3.589, 1.1*(3.6-3.589), -1, 2, DIGI),
+              (3.6, 4-3.6, -1, 2, PHONE),
+              (3.842, 3.845-3.842, -1, 2, TV)],
+     'labels': [(3.536, label2_y, 'CW', 7),
+                (3.592, label2_y, 'D', 7),
+                (3.725, label2_y, 'LSB', 7),
+                (3.839, label2_y, 'TV', 7),
+                (3.91, label2_y, 'LSB', 7)]},
+
+    # Five channels, each shared by CW, USB and Digi
+    {'name': '60m', 'name_y': label4_y,
+     'xlim': (5.327, 5.409),
+     'xticks': [5.3305, 5.3335, 5.3465, 5.3495, 5.3515,
+                5.3665, 5.3715, 5.3745, 5.4035, 5.4065],
+     'rot': 30, 'prec': 4,
+     'bars': [(5.3305, 0.0030, 0.33, 0.67, CW),
+              (5.3465, 0.0030, 0.33, 0.67, CW),
+              (5.3515, 0.0150, 0.33, 0.67, CW),
+              (5.3715, 0.0030, 0.33, 0.67, CW),
+              (5.4035, 0.0030, 0.33, 0.67, CW),
+              (5.3305, 0.0030, -0.33, 0.67, PHONE),
+              (5.3465, 0.0030, -0.33, 0.67, PHONE),
+              (5.3515, 0.0150, -0.33, 0.67, PHONE),
+              (5.3715, 0.0030, -0.33, 0.67, PHONE),
+              (5.4035, 0.0030, -0.33, 0.67, PHONE),
+              (5.3305, 0.0030, -1, 0.67, DIGI),
+              (5.3465, 0.0030, -1, 0.67, DIGI),
+              (5.3515, 0.0150, -1, 0.67, DIGI),
+              (5.3715, 0.0030, -1, 0.67, DIGI),
+              (5.4035, 0.0030, -1, 0.67, DIGI)],
+     'labels': [(5.331, label3_y+0.19, 'CW', 5),
+                (5.331, label2_y+0.13, 'USB', 5),
+                (5.331, label1_y-0.1, 'Digi', 5)]},
+
+    {'name': '40m', 'name_y': label4_y,
+     'xlim': (6.985, 7.315),
+     'xticks': [7, 7.04, 7.07, 7.125, 7.165, 7.175, 7.3],
+     'rot': 35, 'prec': 3,
+     'bars': [(7, 7.04-7, -1, 2, CW),
+              (7.035, 7.04-7.035, -1, 1, DIGI),
+              (7.04, 7.3-7.04, -1, 2, PHONE),
+              (7.07, 7.125-7.07, -1, 1, DIGI),
+              (7.165, 7.175-7.165, -1, 2, TV)],
+     'labels': [(7.015, label2_y, 'CW', 7),
+                (7.0355, label1_y, 'D', 7),
+                (7.093, label1_y, 'Digi', 7),
+                (7.105, label3_y, 'LSB', 7),
+                (7.167, label2_y, 'TV', 7),
+                (7.23, label2_y, 'LSB', 7)]},
+
+    {'name': '30m', 'name_y': label4_y,
+     'xlim': (10.097, 10.153),
+     'xticks': [10.1, 10.13, 10.14, 10.15], 'rot': 20, 'prec': 2,
+     'bars': [(10.1, 10.15-10.1, -1, 2, CW),
+              (10.13, 10.14-10.13, -1, 2, DIGI),
+              (10.14, 10.15-10.14, -1, 1, DIGI)],
+     'labels': [(10.115, label2_y, 'CW', 7),
+                (10.1345, label2_y, 'Digi', 7),
+                (10.1445, label3_y, 'CW', 7)]},
+
+    {'name': '20m', 'name_y': label4_y,
+     'xlim': (13.98, 14.37),
+     'xticks': [14, 14.07, 14.112, 14.230, 14.350], 'rot': 20, 'prec': 3,
+     'bars': [(14, 14.07-14, -1, 2, CW),
+              (14.07, 14.112-14.07, -1, 2, DIGI),
+              (14.073, 14.1005-14.073, 0, 1, CW),
+              (14.112, 14.350-14.112, -1, 2, PHONE),
+              (14.230, 14.236-14.230, -1, 2, TV)],
+     'labels': [(14.033, label2_y, 'CW', 7),
+                (14.082, label3_y, 'CW', 7),
+                (14.087, label1_y, 'Digi', 7),
+                (14.17, label2_y, 'USB', 7),
+                (14.229, label2_y, 'TV', 7),
+                (14.28, label2_y, 'USB', 7)]},
+
+    {'name': '17m', 'name_y': label4_y,
+     'xlim': (18.062, 18.174),
+     'xticks': [18.068, 18.095, 18.1, 18.11, 18.168],
+     'rot': 25, 'prec': 3,
+     'bars': [(18.068, 18.1-18.068, -1, 2, CW),
+              (18.095, 18.1-18.095, -1, 1, DIGI),
+              (18.1, 18.11-18.1, -1, 2, DIGI),
+              (18.11, 18.168-18.11, -1, 2, PHONE)],
+     'labels': [(18.082, label2_y, 'CW', 7),
+                (18.102, label2_y, 'Digi', 7),
+                (18.135, label2_y, 'USB', 7)]},
+
+    {'name': '15m', 'name_y': label4_y,
+     'xlim': (20.975, 21.475),
+     'xticks': [21, 21.07, 21.125, 21.150, 21.340, 21.450],
+     'rot': 20, 'prec': 3,
+     'bars': [(21, 21.150-21, -1, 2, CW),
+              (21.07, 21.125-21.07, -1, 2, DIGI),
+              (21.07-.01, 21.08-21.07+0.01, 0, 1, CW),
+              (21.083, 21.083-21.08, 0, 1, CW),
+              (21.125, 21.150-21.125, -1, 2, CW),
+              (21.150, 21.450-21.150, -1, 2, PHONE),
+              (21.340, 21.343-21.340, -1, 2, TV)],
+     'labels': [(21.03, label2_y, 'CW', 7),
+                (21.095, label2_y, 'Digi', 7),
+                (21.13, label2_y, 'CW', 7),
+                (21.24, label2_y, 'USB', 7),
+                (21.337, label2_y, 'TV', 7),
+                (21.39, label2_y, 'USB', 7)]},
+
+    {'name': '12m', 'name_y': label4_y,
+     'xlim': (24.884, 24.996),
+     'xticks': [24.89, 24.92, 24.925, 24.94, 24.975, 24.990],
+     'rot': 25, 'prec': 3,
+     'bars': [(24.89, 24.92-24.89, -1, 2, CW),
+              (24.92, 24.94-24.92, -1, 2, DIGI),
+              (24.925, 24.94-24.925, 0, 1, CW),
+              (24.94, 24.990-24.94, -1, 2, PHONE),
+              (24.975, 24.978-24.975, -1, 2, TV)],
+     'labels': [(24.904, label2_y, 'CW', 7),
+                (24.9205, label2_y, 'Digi', 7),
+                (24.93, label3_y, 'CW', 7),
+                (24.956, label2_y, 'USB', 7),
+                (24.9755, label2_y, 'TV', 7),
+                (24.982, label2_y, 'USB', 7)]},
+
+    {'name': '10m', 'name_y': label4_y,
+     'xlim': (27.9, 29.8),
+     'xticks': [28, 28.07, 28.1895, 28.32, 28.68, 29.3, 29.52, 29.7],
+     'rot': 25, 'prec': 3,
+     'bars': [(28, 1.1*(28.32-28), -1, 2, CW),
+              (28.07, 1.1*(28.32-28.07), -1, 1, DIGI),
+              (28.1895, 28.3-28.1895, -1, 1, BEACON),
+              (28.1895, 28.2005-28.1895, -1, 2, BEACON),
+              (28.32, 29.7-28.32, -1, 2, PHONE),
+              (28.68, 28.683-28.68, -1, 2, TV),
+              (29.3, 29.52-29.3, -1, 2, MISC)],
+     'labels': [(28.015, label2_y, 'CW', 7),
+                (28.1, label1_y, 'Digi', 7),
+                (28.24, label3_y, 'CW', 7),
+                (28.2, label1_y, 'Beacon', 7),
+                (28.301, label1_y, 'D', 7),
+                (28.47, label2_y, 'USB', 7),
+                (28.665, label2_y, 'TV', 7),
+                (28.95, label2_y, 'USB', 7),
+                (29.39, label2_y, 'Sat', 7),
+                (29.59, label2_y, 'FM', 7)]},
+
+    {'name': '6m', 'name_y': label4_y,
+     'xlim': (49.78, 54.23),
+     'xticks': [50, 50.6, 51.1, 52, 53, 54], 'rot': 25, 'prec': 1,
+     'bars': [(50, 54-50, -1, 2, PHONE),
+              (50, 50.1-50, -1, 0.67, CW),
+              (50, 50.1-50, -0.33, 0.67, BEACON),
+              (50.6, 51-50.6, -1, 2, MISC),
+              (51, 51.1-51, -1, 1, CW),
+              (51.1, 52-51.1, -1, 1, DIGI),
+              (51.1-0.003, 0.005, -1, 2, CHANNEL),
+              (52-0.003, 0.005, -1, 2, CHANNEL),
+              (53-0.003, 0.005, -1, 2, CHANNEL)],
+     'labels': [(50.25, label2_y, 'USB', 7),
+                (50, label1_y-0.1, 'CW', 5),
+                (50, label2_y+0.1, 'Beac', 5),
+                (50.63, label2_y, 'Experimental', 6),
+                (51, label3_y, 'DX', 6),
+                (51, label1_y, 'CW', 6),
+                (51.35, label3_y, 'FM Simplex', 7),
+                (51.43, label1_y, 'Packet', 7),
+                (52.2, label2_y, 'FM Repeater Input', 7),
+                (53.2, label2_y, 'FM Repeater Output', 7)]},
+
+    # 2m  https://wp.rac.ca/144-mhz-2m-page/
+    {'name': '2m', 'name_y': vhf_label4_y,
+     'xlim': (143.9, 148.1),
+     'xticks': [144, 144.370, 144.51, 144.91, 145.11, 145.51, 145.71, 145.8,
+                146.02, 146.415, 146.62, 147, 147.42, 147.6, 148],
+     'rot': 40, 'prec': 3,
+     'bars': [(144, 0.37, 0.70, 0.3, MISC),              # Misc
+              (145.8, 0.2, 0.70, 0.3, MISC),             # Satellite
+              (147.42, 0.165, 0.70, 0.3, MISC),          # Net Linked Simplex
+              (144.37, 0.12, 0.70, 0.3, DIGI),           # Digital Group 1
+              (144.91, 0.18, 0.70, 0.3, DIGI),           # Digital Repeater
+              (145.51, 0.18, 0.70, 0.3, DIGI),           # Group 1 and 2
+              (145.71, 0.08, 0.70, 0.3, DIGI),           # Digital Simplex
+              (144.51, 0.38, 0.70, 0.3, PHONE),          # Repeater Group 1
+              (145.11, 0.38, 0.70, 0.3, PHONE),          # and 2
+              (146.02, 0.36, 0.70, 0.3, PHONE),          # Repeater Group 3
+              (146.62, 0.36, 0.70, 0.3, PHONE),
+              (147, 0.38, 0.70, 0.3, PHONE),             # Repeater Group 4
+              (147.6, 0.38, 0.70, 0.3, PHONE),
+              (146.415, 0.18, 0.70, 0.3, PHONE),         # FM Simplex
+              (144.59, 0.02, 0.70, 0.3, GAP),            # Gaps in Repeater
+              (145.19, 0.02, 0.70, 0.3, GAP)],           # Groups 1 and 2
+     'labels': [(144.13, vhf_label2_y, 'Misc', 7),
+                (144.37, vhf_label2_y, 'Digi', 7),
+                (145.115, vhf_label3_y, 'R$_1$', 7),
+                (145.115, vhf_label1_y, 'out', 7),
+                (144.515, vhf_label3_y, 'R$_1$', 7),
+                (144.515, vhf_label1_y, 'in', 7),
+                (145.27, vhf_label2_y, 'R$_2$ out', 7),
+                (144.67, vhf_label2_y, 'R$_2$ in', 7),
+                (144.91, vhf_label3_y, 'R$_2$', 7),
+                (144.91, vhf_label1_y, 'in', 7),
+                (145.51, vhf_label3_y, 'R$_2$', 7),
+                (145.51, vhf_label1_y, 'out', 7),
+                (145.01, vhf_label3_y, 'R$_1$', 7),
+                (145.01, vhf_label1_y, 'out', 7),
+                (145.61, vhf_label3_y, 'R$_1$', 7),
+                (145.61, vhf_label1_y, 'in', 7),
+                (146.1, vhf_label2_y, 'R$_3$ in', 7),
+                (146.7, vhf_label2_y, 'R$_3$ out', 7),
+                (147.1, vhf_label2_y, 'R$_4$ out', 7),
+                (147.7, vhf_label2_y, 'R$_4$ in', 7),
+                (145.71, vhf_label2_y, 'Sx', 7),
+                (145.85, vhf_label2_y, 'Sat', 7),
+                (146.415, vhf_label2_y, 'Sx', 7),
+                (147.42, vhf_label3_y, 'Net Lk', 7),
+                (147.42, vhf_label1_y, 'Sx', 7)]},
+
+    # 70cm  https://wp.rac.ca/144-mhz-2m-page/
+    {'name': '70cm', 'name_y': vhf_label4_y,
+     'xlim': (429.5, 450.5),
+     'xticks': [430, 431, 431.5, 433.025, 434.025, 435, 438.025, 439.05,
+                440.025, 441, 442, 443.025, 445.025, 446, 447, 448.025, 450],
+     'rot': 40, 'prec': 3,
+     'bars': [(430.05, 0.9, 0.70, 0.3, DIGI),            # Packet Trunked
+              (439.05, 0.9, 0.70, 0.3, DIGI),            # Repeaters
+              (433.025, 0.975, 0.70, 0.3, DIGI),         # Digi Output
+              (438.025, 0.975, 0.70, 0.3, DIGI),         # Digi Input
+              (440.025, 0.925, 0.70, 0.3, DIGI),         # Digital and link
+              (445.025, 0.925, 0.70, 0.3, DIGI),         # repeaters
+              (441, 0.975, 0.70, 0.3, DIGI),             # Simplex P2P links
+              (431, 0.475, 0.70, 0.3, UNALLOCATED),      # Not allocated
+              (431.5, 1.5, 0.70, 0.3, MISC),             # Misc
+              (435, 3, 0.70, 0.3, MISC),                 # Sat
+              (434.025, 0.95, 0.70, 0.3, PHONE),         # Repeater Output
+              (442, 0.975, 0.70, 0.3, PHONE),            # FM Repeaters
+              (447, 0.975, 0.70, 0.3, PHONE),
+              (443.025, 1.95, 0.70, 0.3, PHONE),
+              (448.025, 1.95, 0.70, 0.3, PHONE),
+              (446, 0.975, 0.70, 0.3, PHONE),            # FM Simplex
+              (439.025, 0.95, 0.70, 0.15, PHONE)],       # Repeater Input FIXME
+     'labels': [(430.05, vhf_label3_y, 'Packet', 7),
+                (430.05, vhf_label1_y, 'Output', 7),
+                (439.05, vhf_label3_y, 'Packet', 7),
+                (439.05, vhf_label1_y, 'Input', 7),
+                (432, vhf_label2_y, 'Misc', 7),
+                (433.025, vhf_label3_y, 'R$_1$', 7),
+                (433.025, vhf_label1_y, 'Output', 7),
+                (438.025, vhf_label3_y, 'R$_1$', 7),
+                (438.025, vhf_label1_y, 'Input', 7),
+                (434.025, vhf_label3_y, 'R$_1$', 7),
+                (434.025, vhf_label1_y, 'Output', 7),
+                (436.3, vhf_label2_y, 'Sat', 7),
+                (440.025, vhf_label3_y, 'Digi', 7),
+                (440.025, vhf_label1_y, 'Output', 7),
+                (445.025, vhf_label3_y, 'Digi', 7),
+                (445.025, vhf_label1_y, 'Input', 7),
+                (440.9, vhf_label3_y, 'Simplex', 7),
+                (441, vhf_label1_y, 'Link', 7),
+                (442, vhf_label3_y, 'R$_2$', 7),
+                (442, vhf_label1_y, 'Output', 7),
+                (447, vhf_label3_y, 'R$_2$', 7),
+                (447, vhf_label1_y, 'Input', 7),
+                (443.025, vhf_label3_y, 'R$_3$', 7),
+                (443.025, vhf_label1_y, 'Output', 7),
+                (448.025, vhf_label3_y, 'R$_3$', 7),
+                (448.025, vhf_label1_y, 'Input', 7),
+                (446, vhf_label2_y, 'Simplex', 7)]},
+]
+
+
+def plot_vswr(a, f, v):
+    '''Plot the measured VSWR v against the frequencies f on axes a.'''
+    a.plot(f, v, color=SWRCOLOUR, rasterized=f.size > RASTER_POINTS)
+
+
+def make_page(nrows):
+    '''Return a portrait figure with nrows graphs set up for the HF bands:
+    VSWR from -1 to 10 with reference lines at 1 and 3.'''
+    fig, ax = plt.subplots(nrows=nrows, figsize=(8.5, 11))
+    plt.setp(ax, ylim=(-1, 10), yticks=y_ticks, ylabel='VSWR')
+    for a in ax:
+        # Drawn before the curve, so lift them above it (lines are at 2).
+        for vswr in (1, 3):
+            a.axhline(vswr, ls='--', color='black', linewidth=0.5, zorder=2.5)
+    return fig, ax
+
+
+def add_labels(a, labels):
+    '''Write each (x, y, text, fontsize) of labels on axes a.'''
+    for x, y, text, size in labels:
+        a.annotate(text, (x, y), fontsize=size, annotation_clip=False)
+
+
+def plot_band(a, b, f, v):
+    '''Draw band b of the BANDS table on axes a, with the measured VSWR v
+    against the frequencies f.'''
+    left, right = b['xlim']
+    a.set_xlim(left, right)
 
+    # SWR Data
+    plot_vswr(a, f, v)   # Measured VSWR
 
-# FIRST PAGE:  2200m to 20m
-# Axes: 7 graphs on a 8.5x11 page.
-fig, ax = plt.subplots(nrows=8, figsize=(8.5, 11))
+    # Bar Graphs
+    for (y, height, colour), bars in groupby(b['bars'], lambda bar: bar[2:]):
+        a.broken_barh([(x, width) for x, width, *_ in bars], (y, height),
+                      facecolors=colour)
 
-# title on first [0] graph only
-ax[0].set(title=title)
+    # Labels
+    a.text(left, b['name_y'], ' ' + b['name'])
+    add_labels(a, b['labels'])
+
+    # Axis
+    prec = b['prec']
+    a.xaxis.set_major_formatter(
+        mtick.FuncFormatter(lambda x, pos: f'{x:.{prec}f}'))
+    a.set_xticks(b['xticks'])
+    a.tick_params(axis='x', labelrotation=b['rot'])
+    plt.setp(a.get_xticklabels(), ha='right')
+
+
+def first_page(xy, band_rows):
+    '''Return the first page: 2200m to 20m.'''
+    # Axes: 8 graphs on a 8.5x11 page.
+    fig, ax = make_page(8)
+
+    # title on first [0] graph only
+    ax[0].set(title=title)
+
+    for i, b in enumerate(BANDS[:8]):
+        plot_band(ax[i], b, *visible(xy, *band_rows[i]))
+    return fig
 
-# Axis labels
-for i in range(0, 8):
-    ax[i].set(ylabel='VSWR')  # Set x-and y-axis labels
-    # SWR Data
-    ax[i].plot(freq, VSWR, color=SWRCOLOUR)   # Measured VSWR
-    ax[i].plot(freq, VSWR1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
-    ax[i].plot(freq, VSWR3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
-
-
-# 2200m
-i = 0                        # First graph
-left = 0.1356                # Left edge
-right = 0.1379               # Right edge
-ax[i].set_xlim(left, right)  # Domain
-ax[i].set_ylim(-1, 10)       # Range
-
-# frequency labels:
-x1 = 0.1357
-x2 = 0.1374
-x3 = 0.1376
-x4 = 0.1378
-xlabels = [x1, x2, x3, x4]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, 1.1*(x2-x1))], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, 1.1*(x3-x2))], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x3, x4-x3)], (-1, 2), facecolors=MISC)  # QRSS
-
-# Labels
-ax[i].text(left, label4_y, ' 2200m')
-ax[i].text(0.13655, label2_y, 'CW', fontsize=7)
-ax[i].text(0.13747, label2_y, 'Digi', fontsize=7)
-ax[i].text(0.13765, label2_y, 'QRSS', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=20, ha='right')
-
-
-# 630m
-i += 1                       # First graph
-left = 0.4716                # Left edge
-right = 0.4794               # Right edge
-ax[i].set_xlim(left, right)  # Domain
-ax[i].set_ylim(-1, 10)       # Range
-
-# frequency labels:
-x1 = 0.472
-x2 = 0.475
-x3 = 0.479
-xlabels = [x1, x2, x3]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, (x3-x1))], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, (x3-x2))], (-1, 1), facecolors=DIGI)
-
-# Labels
-ax[i].text(left, label4_y, ' 630m')
-ax[i].text(0.4735, label2_y, 'CW', fontsize=7)
-ax[i].text(0.4768, label2_y, 'Digi', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=20, ha='right')
-
-
-# 160m
-i += 1
-left = 1.79
-right = 2.01
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 1.800
-x2 = 1.810
-x3 = 1.840
-x4 = 2.000
-xlabels = [x1, x2, x3, x4]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, 1.1*(x3-x1))], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x1, (x2-x1))], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x3, (x4-x3))], (-1, 2), facecolors=PHONE)
-
-# Labels
-ax[i].text(left, label4_y, ' 160m')
-ax[i].text(1.817, label2_y, 'CW', fontsize=7)
-ax[i].text(1.915, label2_y, 'LSB', fontsize=7)
-ax[i].text(1.801, label1_y, 'Digi', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=25, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 80m
-i += 1
-left = 3.475
-right = 4.025
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 3.5
-x2 = 3.58
-x3 = 3.589
-x4 = 3.6
-x5 = 3.842
-x6 = 3.845
-x7 = 4
-xlabels = [x1, x2, x4, x5, x7]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x3-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, 0.003)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x3, 1.1*(x4-x3))], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x4, x7-x4)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x5, x6-x5)], (-1, 2), facecolors=TV)
-
-# Labels
-ax[i].text(left, label4_y, ' 80m')
-ax[i].text(3.536, label2_y, 'CW', fontsize=7)
-ax[i].text(3.592, label2_y, 'D', fontsize=7)
-ax[i].text(3.725, label2_y, 'LSB', fontsize=7)
-ax[i].text(3.839, label2_y, 'TV', fontsize=7)
-ax[i].text(3.91, label2_y, 'LSB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=30, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 60m
-i += 1
-left = 5.327
-right = 5.409
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 5.3305
-x2 = 5.3465
-x3 = 5.3515
-x4 = 5.3715
-x5 = 5.4035
-xlabels = [x1, x1 + 0.0030, x2, x2 + 0.0030, x3, x3 + 0.0150,
-           x4, x4 + 0.0030, x5, x5 + 0.0030]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, 0.0030)], (0.33, 0.67), facecolors=CW)
-ax[i].broken_barh([(x1, 0.0030)], (-0.33, 0.67), facecolors=PHONE)
-ax[i].broken_barh([(x1, 0.0030)], (-1, 0.67), facecolors=DIGI)
-ax[i].broken_barh([(x2, 0.0030)], (0.33, 0.67), facecolors=CW)
-ax[i].broken_barh([(x2, 0.0030)], (-0.33, 0.67), facecolors=PHONE)
-ax[i].broken_barh([(x2, 0.0030)], (-1, 0.67), facecolors=DIGI)
-ax[i].broken_barh([(x3, 0.0150)], (0.33, 0.67), facecolors=CW)
-ax[i].broken_barh([(x3, 0.0150)], (-0.33, 0.67), facecolors=PHONE)
-ax[i].broken_barh([(x3, 0.0150)], (-1, 0.67), facecolors=DIGI)
-ax[i].broken_barh([(x4, 0.0030)], (0.33, 0.67), facecolors=CW)
-ax[i].broken_barh([(x4, 0.0030)], (-0.33, 0.67), facecolors=PHONE)
-ax[i].broken_barh([(x4, 0.0030)], (-1, 0.67), facecolors=DIGI)
-ax[i].broken_barh([(x5, 0.0030)], (0.33, 0.67), facecolors=CW)
-ax[i].broken_barh([(x5, 0.0030)], (-0.33, 0.67), facecolors=PHONE)
-ax[i].broken_barh([(x5, 0.0030)], (-1, 0.67), facecolors=DIGI)
-
-# Labels
-ax[i].text(left, label4_y, ' 60m')
-ax[i].text(5.331, label3_y+0.19, 'CW', fontsize=5)
-ax[i].text(5.331, label2_y+0.13, 'USB', fontsize=5)
-ax[i].text(5.331, label1_y-0.1, 'Digi', fontsize=5)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=30, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.4f'))
-
-
-# 40m
-i += 1
-left = 6.985
-right = 7.315
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 7
-x2 = 7.035
-x3 = 7.04
-x4 = 7.07
-x5 = 7.125
-x6 = 7.165
-x7 = 7.175
-x8 = 7.3
-xlabels = [x1, x3, x4, x5, x6, x7, x8]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x3-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x3-x2)], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x3, x8-x3)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x4, x5-x4)], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x6, x7-x6)], (-1, 2), facecolors=TV)
-
-# Labels
-ax[i].text(left, label4_y, ' 40m')
-ax[i].text(7.015, label2_y, 'CW', fontsize=7)
-ax[i].text(7.0355, label1_y, 'D', fontsize=7)
-ax[i].text(7.093, label1_y, 'Digi', fontsize=7)
-ax[i].text(7.105, label3_y, 'LSB', fontsize=7)
-ax[i].text(7.167, label2_y, 'TV', fontsize=7)
-ax[i].text(7.23, label2_y, 'LSB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=35, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 30m
-i += 1
-left = 10.097
-right = 10.153
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 10.1
-x2 = 10.13
-x3 = 10.14
-x4 = 10.15
-xlabels = [x1, x2, x3, x4]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, (x4-x1))], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x3-x2)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x3, x4-x3)], (-1, 1), facecolors=DIGI)
-
-# Labels
-ax[i].text(left, label4_y, ' 30m')
-ax[i].text(10.115, label2_y, 'CW', fontsize=7)
-ax[i].text(10.1345, label2_y, 'Digi', fontsize=7)
-ax[i].text(10.1445, label3_y, 'CW', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=20, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.2f'))
-
-
-# 20m
-i += 1
-left = 13.98
-right = 14.37
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 14
-x2 = 14.07
-x3 = 14.073
-x4 = 14.1005
-x5 = 14.112
-x6 = 14.230
-x7 = 14.236
-x8 = 14.350
-xlabels = [x1, x2, x5, x6, x8]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x2-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x5-x2)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x3, x4-x3)], (0, 1), facecolors=CW)
-ax[i].broken_barh([(x5, x8-x5)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x6, x7-x6)], (-1, 2), facecolors=TV)
-
-# Labels
-ax[i].text(left, label4_y, ' 20m')
-ax[i].text(14.033, label2_y, 'CW', fontsize=7)
-ax[i].text(14.082, label3_y, 'CW', fontsize=7)
-ax[i].text(14.087, label1_y, 'Digi', fontsize=7)
-ax[i].text(14.17, label2_y, 'USB', fontsize=7)
-ax[i].text(14.229, label2_y, 'TV', fontsize=7)
-ax[i].text(14.28, label2_y, 'USB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=20, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# Print First Page
-fig.tight_layout()
-pdf_pages.savefig(fig)
-# plt.savefig('CanBanPlan1.svg', transparent=False)
-
-
-# SECOND PAGE: 17m - 70cm
-# Axes
-fig2, ax = plt.subplots(nrows=7, figsize=(8.5, 11))
-
-# Axis labels
-for i in range(0, 7):
-    ax[i].set(ylabel='VSWR')  # Set x-and y-axis labels
-    # SWR Data
-    ax[i].plot(freq, VSWR, color=SWRCOLOUR)   # Measured VSWR
-    ax[i].plot(freq, VSWR1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
-    ax[i].plot(freq, VSWR3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
-
-
-# 17m
-i = 0
-left = 18.062
-right = 18.174
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 18.068
-x2 = 18.095
-x3 = 18.1
-x4 = 18.11
-x5 = 18.168
-xlabels = [x1, x2, x3, x4, x5]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x3-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x3-x2)], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x3, x4-x3)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x4, x5-x4)], (-1, 2), facecolors=PHONE)
-
-# Labels
-ax[i].text(left, label4_y, ' 17m')
-ax[i].text(18.082, label2_y, 'CW', fontsize=7)
-ax[i].text(18.102, label2_y, 'Digi', fontsize=7)
-ax[i].text(18.135, label2_y, 'USB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=25, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 15m
-i += 1
-left = 20.975
-right = 21.475
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 21
-x2 = 21.07
-x3 = 21.08
-x4 = 21.083
-x5 = 21.09
-x6 = 21.125
-x7 = 21.150
-x8 = 21.340
-x9 = 21.343
-x10 = 21.450
-xlabels = [x1, x2, x6, x7, x8, x10]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x7-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x6-x2)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x2-.01, x3-x2+0.01)], (0, 1), facecolors=CW)
-ax[i].broken_barh([(x4, x4-x3)], (0, 1), facecolors=CW)
-ax[i].broken_barh([(x6, x7-x6)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x7, x10-x7)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x8, x9-x8)], (-1, 2), facecolors=TV)
-
-# Labels
-ax[i].text(left, label4_y, ' 15m')
-ax[i].text(21.03, label2_y, 'CW', fontsize=7)
-ax[i].text(21.095, label2_y, 'Digi', fontsize=7)
-ax[i].text(21.13, label2_y, 'CW', fontsize=7)
-ax[i].text(21.24, label2_y, 'USB', fontsize=7)
-ax[i].text(21.337, label2_y, 'TV', fontsize=7)
-ax[i].text(21.39, label2_y, 'USB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=20, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 12m
-i += 1
-left = 24.884
-right = 24.996
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 24.89
-x2 = 24.92
-x3 = 24.925
-x4 = 24.94
-x5 = 24.975
-x6 = 24.978
-x7 = 24.990
-xlabels = [x1, x2, x3, x4, x5, x7]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x2-x1)], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, x4-x2)], (-1, 2), facecolors=DIGI)
-ax[i].broken_barh([(x3, x4-x3)], (0, 1), facecolors=CW)
-ax[i].broken_barh([(x4, x7-x4)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x5, x6-x5)], (-1, 2), facecolors=TV)
-
-# Labels
-ax[i].text(left, label4_y, ' 12m')
-ax[i].text(24.904, label2_y, 'CW', fontsize=7)
-ax[i].text(24.9205, label2_y, 'Digi', fontsize=7)
-ax[i].text(24.93, label3_y, 'CW', fontsize=7)
-ax[i].text(24.956, label2_y, 'USB', fontsize=7)
-ax[i].text(24.9755, label2_y, 'TV', fontsize=7)
-ax[i].text(24.982, label2_y, 'USB', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=25, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 10m
-i += 1
-left = 27.9
-right = 29.8
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 28
-x2 = 28.07
-x3 = 28.1895
-x4 = 28.2005
-x5 = 28.3
-x6 = 28.32
-x7 = 28.68
-x8 = 28.683
-x9 = 29.3
-x10 = 29.52
-x11 = 29.7
-xlabels = [x1, x2, x3, x6, x7, x9, x10, x11]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, 1.1*(x6-x1))], (-1, 2), facecolors=CW)
-ax[i].broken_barh([(x2, 1.1*(x6-x2))], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x3, x5-x3)], (-1, 1), facecolors=BEACON)
-ax[i].broken_barh([(x3, x4-x3)], (-1, 2), facecolors=BEACON)
-ax[i].broken_barh([(x6, x11-x6)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x7, x8-x7)], (-1, 2), facecolors=TV)
-ax[i].broken_barh([(x9, x10-x9)], (-1, 2), facecolors=MISC)
-
-# Labels
-ax[i].text(left, label4_y, ' 10m')
-ax[i].text(28.015, label2_y, 'CW', fontsize=7)
-ax[i].text(28.1, label1_y, 'Digi', fontsize=7)
-ax[i].text(28.24, label3_y, 'CW', fontsize=7)
-ax[i].text(28.2, label1_y, 'Beacon', fontsize=7)
-ax[i].text(28.301, label1_y, 'D', fontsize=7)
-ax[i].text(28.47, label2_y, 'USB', fontsize=7)
-ax[i].text(28.665, label2_y, 'TV', fontsize=7)
-ax[i].text(28.95, label2_y, 'USB', fontsize=7)
-ax[i].text(29.39, label2_y, 'Sat', fontsize=7)
-ax[i].text(29.59, label2_y, 'FM', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=25, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 6m
-i += 1
-left = 49.78
-right = 54.23
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(-1, 10)
-
-# frequency labels:
-x1 = 50
-x2 = 50.1
-x3 = 50.6
-x4 = 51
-x5 = 51.1
-x6 = 52
-x7 = 53
-x8 = 54
-xlabels = [x1, x3, x5, x6, x7, x8]
-
-# Bar Graphs
-ax[i].broken_barh([(x1, x8-x1)], (-1, 2), facecolors=PHONE)
-ax[i].broken_barh([(x1, x2-x1)], (-1, 0.67), facecolors=CW)
-ax[i].broken_barh([(x1, x2-x1)], (-0.33, 0.67), facecolors=BEACON)
-ax[i].broken_barh([(x3, x4-x3)], (-1, 2), facecolors=MISC)
-ax[i].broken_barh([(x4, x5-x4)], (-1, 1), facecolors=CW)
-ax[i].broken_barh([(x5, x6-x5)], (-1, 1), facecolors=DIGI)
-ax[i].broken_barh([(x5-0.003, 0.005)], (-1, 2), facecolors='black')
-ax[i].broken_barh([(x6-0.003, 0.005)], (-1, 2), facecolors='black')
-ax[i].broken_barh([(x7-0.003, 0.005)], (-1, 2), facecolors='black')
-
-# Label
-ax[i].text(left, label4_y, ' 6m')
-ax[i].text(50.25, label2_y, 'USB', fontsize=7)
-ax[i].text(50, label1_y-0.1, 'CW', fontsize=5)
-ax[i].text(50, label2_y+0.1, 'Beac', fontsize=5)
-ax[i].text(50.63, label2_y, 'Experimental', fontsize=6)
-ax[i].text(51, label3_y, 'DX', fontsize=6)
-ax[i].text(51, label1_y, 'CW', fontsize=6)
-ax[i].text(51.35, label3_y, 'FM Simplex', fontsize=7)
-ax[i].text(51.43, label1_y, 'Packet', fontsize=7)
-ax[i].text(52.2, label2_y, 'FM Repeater Input', fontsize=7)
-ax[i].text(53.2, label2_y, 'FM Repeater Output', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_ylim((-1, 10))
-ax[i].set_yticks(y_ticks)
-ax[i].set_xticklabels(xlabels, rotation=25, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.1f'))
-
-
-# Re-define vertical coordinates of labels for 2m and 70cm
-label1_y = 0.73    # Lower label
-label2_y = 0.79    # Centre label
-label3_y = 0.88      # Top label
-label4_y = 1.85      # Very top band name
-
-# 2m  https://wp.rac.ca/144-mhz-2m-page/
-i += 1
-left = 143.9
-right = 148.1
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(0.7, 2.1)
-
-# frequency labels:
-ax[i].text(left, label4_y, ' 2m')
-xlabels = [144, 148]
-
-# Misc
-ax[i].broken_barh([(144, 0.37)], (0.70, 0.3), facecolors=MISC)
-ax[i].text(144.13, label2_y, 'Misc', fontsize=7)
-
-# Digital Group 1
-xlabels = xlabels + [144.370]
-ax[i].broken_barh([(144.37, 0.12)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(144.37, label2_y, 'Digi', fontsize=7)
-
-# Repeater Group 1 and 2
-xlabels = xlabels + [144.51, 145.11]
-ax[i].broken_barh([(144.51, 0.38)], (0.70, 0.3), facecolors=PHONE)
-ax[i].broken_barh([(145.11, 0.38)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(145.115, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(145.115, label1_y, 'out', fontsize=7)
-ax[i].text(144.515, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(144.515, label1_y, 'in', fontsize=7)
-ax[i].text(145.27, label2_y, 'R$_2$ out', fontsize=7)
-ax[i].text(144.67, label2_y, 'R$_2$ in', fontsize=7)
-ax[i].broken_barh([(144.59, 0.02)], (0.70, 0.3), facecolors='white')
-ax[i].broken_barh([(145.19, 0.02)], (0.70, 0.3), facecolors='white')
-
-# Digital Repeater Group 1 and 2
-xlabels = xlabels + [144.91, 145.51]
-ax[i].broken_barh([(144.91, 0.18)], (0.70, 0.3), facecolors=DIGI)
-ax[i].broken_barh([(145.51, 0.18)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(144.91, label3_y, 'R$_2$', fontsize=7)
-ax[i].text(144.91, label1_y, 'in', fontsize=7)
-ax[i].text(145.51, label3_y, 'R$_2$', fontsize=7)
-ax[i].text(145.51, label1_y, 'out', fontsize=7)
-ax[i].text(145.01, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(145.01, label1_y, 'out', fontsize=7)
-ax[i].text(145.61, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(145.61, label1_y, 'in', fontsize=7)
-
-# Repeater Group 3
-xlabels = xlabels + [146.02, 146.62]
-ax[i].broken_barh([(146.02, 0.36)], (0.70, 0.3), facecolors=PHONE)
-ax[i].broken_barh([(146.62, 0.36)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(146.1, label2_y, 'R$_3$ in', fontsize=7)
-ax[i].text(146.7, label2_y, 'R$_3$ out', fontsize=7)
-
-# Repeater Group 4
-xlabels = xlabels + [147, 147.6]
-ax[i].broken_barh([(147, 0.38)], (0.70, 0.3), facecolors=PHONE)
-ax[i].broken_barh([(147.6, 0.38)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(147.1, label2_y, 'R$_4$ out', fontsize=7)
-ax[i].text(147.7, label2_y, 'R$_4$ in', fontsize=7)
-
-# Digital Simplex
-xlabels = xlabels + [145.71]
-ax[i].broken_barh([(145.71, 0.08)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(145.71, label2_y, 'Sx', fontsize=7)
-
-# Satellite
-xlabels = xlabels + [145.8]
-ax[i].broken_barh([(145.8, 0.2)], (0.70, 0.3), facecolors=MISC)
-ax[i].text(145.85, label2_y, 'Sat', fontsize=7)
-
-# FM Simplex
-xlabels = xlabels + [146.415]
-ax[i].broken_barh([(146.415, 0.18)], (0.70, 0.3), facecolors=PHONE)
-ax[i].broken_barh([(147.6, 0.38)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(146.415, label2_y, 'Sx', fontsize=7)
-ax[i].text(147.7, label2_y, 'R$_4$ in', fontsize=7)
-
-# Internet Linked Simplex
-xlabels = xlabels + [147.42]
-ax[i].broken_barh([(147.42, 0.165)], (0.70, 0.3), facecolors=MISC)
-ax[i].text(147.42, label3_y, 'Net Lk', fontsize=7)
-ax[i].text(147.42, label1_y, 'Sx', fontsize=7)
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_xticklabels(xlabels, rotation=40, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# 70cm  https://wp.rac.ca/144-mhz-2m-page/
-i += 1
-left = 429.5
-right = 450.5
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(0.7, 2.1)
-
-# frequency labels:
-ax[i].text(left, label4_y, ' 70cm')
-xlabels = [430, 450]
-
-# Packet Trunked Repeaters
-xlabels = xlabels + [439.05]
-ax[i].broken_barh([(430.05, 0.9)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(430.05, label3_y, 'Packet', fontsize=7)
-ax[i].text(430.05, label1_y, 'Output', fontsize=7)
-ax[i].broken_barh([(439.05, 0.9)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(439.05, label3_y, 'Packet', fontsize=7)
-ax[i].text(439.05, label1_y, 'Input', fontsize=7)
-
-# Not allocated
-xlabels = xlabels + [431]
-ax[i].broken_barh([(431, 0.475)], (0.70, 0.3), facecolors='grey')
-
-# Misc
-xlabels = xlabels + [431.5]
-ax[i].broken_barh([(431.5, 1.5)], (0.70, 0.3), facecolors=MISC)
-ax[i].text(432, label2_y, 'Misc', fontsize=7)
-
-# Digi Output
-xlabels = xlabels + [433.025]
-ax[i].broken_barh([(433.025, 0.975)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(433.025, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(433.025, label1_y, 'Output', fontsize=7)
-
-# Digi Input
-xlabels = xlabels + [438.025]
-ax[i].broken_barh([(438.025, 0.975)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(438.025, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(438.025, label1_y, 'Input', fontsize=7)
-
-# Repeater Output
-xlabels = xlabels + [434.025]
-ax[i].broken_barh([(434.025, 0.95)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(434.025, label3_y, 'R$_1$', fontsize=7)
-ax[i].text(434.025, label1_y, 'Output', fontsize=7)
-
-# Repeater Input FIXME
-# xlabels = xlabels + [439.025]
-ax[i].broken_barh([(439.025, 0.95)], (0.70, 0.15), facecolors=PHONE)
-# ax[i].text(439.025, label3_y, 'R$_1$', fontsize=7)
-# ax[i].text(439.025, label1_y, 'Input', fontsize=7)
-
-# Sat
-xlabels = xlabels + [435]
-ax[i].broken_barh([(435, 3)], (0.70, 0.3), facecolors=MISC)
-ax[i].text(436.3, label2_y, 'Sat', fontsize=7)
-
-# Digital and link repeaters, except where used by IC Output
-xlabels = xlabels + [440.025]
-ax[i].broken_barh([(440.025, 0.925)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(440.025, label3_y, 'Digi', fontsize=7)
-ax[i].text(440.025, label1_y, 'Output', fontsize=7)
-
-# Digital and link repeaters, except where used by IC Input
-xlabels = xlabels + [445.025]
-ax[i].broken_barh([(445.025, 0.925)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(445.025, label3_y, 'Digi', fontsize=7)
-ax[i].text(445.025, label1_y, 'Input', fontsize=7)
-
-# Simplex Point-to-Point links
-xlabels = xlabels + [441]
-ax[i].broken_barh([(441, 0.975)], (0.70, 0.3), facecolors=DIGI)
-ax[i].text(440.9, label3_y, 'Simplex', fontsize=7)
-ax[i].text(441, label1_y, 'Link', fontsize=7)
-
-# FM Repeaters Output
-xlabels = xlabels + [442]
-ax[i].broken_barh([(442, 0.975)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(442, label3_y, 'R$_2$', fontsize=7)
-ax[i].text(442, label1_y, 'Output', fontsize=7)
-
-# FM Repeaters Input
-xlabels = xlabels + [447]
-ax[i].broken_barh([(447, 0.975)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(447, label3_y, 'R$_2$', fontsize=7)
-ax[i].text(447, label1_y, 'Input', fontsize=7)
-
-# FM Repeaters Output
-xlabels = xlabels + [443.025]
-ax[i].broken_barh([(443.025, 1.95)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(443.025, label3_y, 'R$_3$', fontsize=7)
-ax[i].text(443.025, label1_y, 'Output', fontsize=7)
-
-# FM Repeaters Input
-xlabels = xlabels + [448.025]
-ax[i].broken_barh([(448.025, 1.95)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(448.025, label3_y, 'R$_3$', fontsize=7)
-ax[i].text(448.025, label1_y, 'Input', fontsize=7)
-
-# FM Simplex
-xlabels = xlabels + [446]
-ax[i].broken_barh([(446, 0.975)], (0.70, 0.3), facecolors=PHONE)
-ax[i].text(446, label2_y, 'Simplex', fontsize=7)
-
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_xticks(xlabels)
-ax[i].set_xticklabels(xlabels, rotation=40, ha='right')
-ax[i].xaxis.set_major_formatter(mtick.FormatStrFormatter('%1.3f'))
-
-
-# Print second page
-fig2.tight_layout()
-pdf_pages.savefig(fig2)
-# plt.savefig('CanBanPlan2.svg', transparent=False)
-# plt.savefig('CanBanPlan2.pdf', transparent=False)
-
-
-# Third Page
-
-# Axis: 2 graphs on a 11x8.5 sheet (landscape)
-fig3, ax = plt.subplots(nrows=2, figsize=(11, 8.5))
-
-
-# HF
-i = 0
-ax[i].set(title='HF')
-left = 0
-right = 55
-y_ticks = [1, 3, 5, 10, 15, 20, 25]
-
-# Axis
-ax[i].set_xlim((left, right))
-ax[i].set_ylim(-0.3, 25)
-ax[i].set_yticks(y_ticks)
-
-# 160m
-ax[i].broken_barh([(1.8, 0.2)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(1.0, -1, '160m', fontsize=7)
-
-# 80m
-ax[i].broken_barh([(3.5, 0.5)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(3.2, -1, '80m', fontsize=7)
-
-# 60m
-ax[i].broken_barh([(5.3305, 0.076)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(5.05, -1, '60m', fontsize=7)
-
-# 40m
-ax[i].broken_barh([(7, 0.3)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(6.8, -1, '40m', fontsize=7)
-
-# 30m
-ax[i].broken_barh([(10.1, 0.05)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(10.15, label2_y-0.7, '← 30m', fontsize=7)
-
-# 20m
-ax[i].broken_barh([(14, 0.3)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(13.7, -1, '20m', fontsize=7)
-
-# 17m
-ax[i].broken_barh([(18.068, 0.1)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(17.8, -1, '17m', fontsize=7)
-
-# 15m
-ax[i].broken_barh([(21, 0.4)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(20.7, -1, '15m', fontsize=7)
-
-# 12m
-ax[i].broken_barh([(24.89, 0.1)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(24.6, -1, '12m', fontsize=7)
-
-# 10m
-ax[i].broken_barh([(28, 1.7)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(28, -1, '10m', fontsize=7)
-
-# 50m
-ax[i].broken_barh([(50, 4)], (-0.3, 1.3), facecolors=OVERVIEW)
-ax[i].text(51.5, -1, '6m', fontsize=7)
 
+def second_page(xy, band_rows):
+    '''Return the second page: 17m to 70cm.'''
+    # Axes: 7 graphs on a 8.5x11 page.
+    fig, ax = make_page(7)
+    plt.setp(ax[5:], ylim=(0.7, 2.1), yticks=[1, 2])   # 2m and 70cm
 
-# SWR Data
-ax[i].plot(freq, VSWR, color=SWRCOLOUR)   # Measured VSWR
-ax[i].plot(freq, VSWR1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
-ax[i].plot(freq, VSWR3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
-ax[i].plot(freq, VSWR10, ls='--', color='black', linewidth=0.5)  # VSWR = 10
-ax[i].set(ylabel='VSWR', xlabel='freq [MHz]')  # Set x-and y-axis labels
-
+    for i, b in enumerate(BANDS[8:]):
+        plot_band(ax[i], b, *visible(xy, *band_rows[8 + i]))
+    return fig
 
-# VHF / UHF
-i += 1
-ax[i].set(title='VHF and UHF')
-left = 100
-right = 500
-y_ticks = [1, 1.5, 2, 3, 5]
-ax[i].set_xlim(left, right)
-ax[i].set_ylim(0.8, 5)
-ax[i].set_yticks(y_ticks)
 
-# 2m
-ax[i].broken_barh([(144, 4)], (0.80, 0.2), facecolors=OVERVIEW)
-ax[i].text(138, 0.7, '2m', fontsize=7)
+def third_page(xy, band_rows):
+    '''Return the third page: HF, VHF and UHF overview.'''
+    # Axis: 2 graphs on a 11x8.5 sheet (landscape)
+    fig, ax = plt.subplots(nrows=2, figsize=(11, 8.5))
 
-# 135cm
-ax[i].broken_barh([(222, 3)], (0.80, 0.2), facecolors=OVERVIEW)
-ax[i].text(220, 0.7, '135cm', fontsize=7)
+    # HF
+    i = 0
+    ax[i].set(title='HF')
+    left = 0
+    right = 55
+    y_ticks = [1, 3, 5, 10, 15, 20, 25]
 
-# 70cm
-ax[i].broken_barh([(430, 20)], (0.80, 0.2), facecolors=OVERVIEW)
-ax[i].text(430, 0.7, '70cm', fontsize=7)
+    # Axis
+    ax[i].set_xlim((left, right))
+    ax[i].set_ylim(-0.3, 25)
+    ax[i].set_yticks(y_ticks)
 
-# SWR Data
-ax[i].plot(freq, VSWR, color=SWRCOLOUR)   # Measured VSWR
-ax[i].plot(freq, VSWR1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
-ax[i].plot(freq, VSWR3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
-ax[i].set(ylabel='VSWR', xlabel='freq [MHz]')  # Set x-and y-axis labels
+    # 160m
+    ax[i].broken_barh([(1.8, 0.2)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(1.0, -1, '160m', fontsize=7)
 
+    # 80m
+    ax[i].broken_barh([(3.5, 0.5)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(3.2, -1, '80m', fontsize=7)
 
-# Print Third page
-fig3.tight_layout()
-pdf_pages.savefig(fig3)
-pdf_pages.close()
+    # 60m
+    ax[i].broken_barh([(5.3305, 0.076)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(5.05, -1, '60m', fontsize=7)
+
+    # 40m
+    ax[i].broken_barh([(7, 0.3)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(6.8, -1, '40m', fontsize=7)
+
+    # 30m
+    ax[i].broken_barh([(10.1, 0.05)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(10.15, 0.09, '← 30m', fontsize=7)
+
+    # 20m
+    ax[i].broken_barh([(14, 0.3)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(13.7, -1, '20m', fontsize=7)
+
+    # 17m
+    ax[i].broken_barh([(18.068, 0.1)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(17.8, -1, '17m', fontsize=7)
+
+    # 15m
+    ax[i].broken_barh([(21, 0.4)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(20.7, -1, '15m', fontsize=7)
+
+    # 12m
+    ax[i].broken_barh([(24.89, 0.1)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(24.6, -1, '12m', fontsize=7)
+
+    # 10m
+    ax[i].broken_barh([(28, 1.7)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(28, -1, '10m', fontsize=7)
+
+    # 50m
+    ax[i].broken_barh([(50, 4)], (-0.3, 1.3), facecolors=OVERVIEW)
+    ax[i].text(51.5, -1, '6m', fontsize=7)
+
+    # SWR Data
+    plot_vswr(ax[i], *band(xy, left, right))   # Measured VSWR
+    ax[i].axhline(1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
+    ax[i].axhline(3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
+    ax[i].axhline(10, ls='--', color='black', linewidth=0.5)  # VSWR = 10
+    ax[i].set(ylabel='VSWR', xlabel='freq [MHz]')  # Set x-and y-axis labels
+
+    # VHF / UHF
+    i += 1
+    ax[i].set(title='VHF and UHF')
+    left = 100
+    right = 500
+    y_ticks = [1, 1.5, 2, 3, 5]
+    ax[i].set_xlim(left, right)
+    ax[i].set_ylim(0.8, 5)
+    ax[i].set_yticks(y_ticks)
+
+    # 2m
+    ax[i].broken_barh([(144, 4)], (0.80, 0.2), facecolors=OVERVIEW)
+    ax[i].text(138, 0.7, '2m', fontsize=7)
+
+    # 135cm
+    ax[i].broken_barh([(222, 3)], (0.80, 0.2), facecolors=OVERVIEW)
+    ax[i].text(220, 0.7, '135cm', fontsize=7)
+
+    # 70cm
+    ax[i].broken_barh([(430, 20)], (0.80, 0.2), facecolors=OVERVIEW)
+    ax[i].text(430, 0.7, '70cm', fontsize=7)
+
+    # SWR Data
+    plot_vswr(ax[i], *band(xy, left, right))   # Measured VSWR
+    ax[i].axhline(1, ls='--', color='black', linewidth=0.5)  # VSWR = 1
+    ax[i].axhline(3, ls='--', color='black', linewidth=0.5)  # VSWR = 3
+    ax[i].set(ylabel='VSWR', xlabel='freq [MHz]')  # Set x-and y-axis labels
+    return fig
+
+
+# Pages of the PDF document, each drawn from the sorted frequencies and VSWR
+# and the index range of every band.
+PAGES = (first_page, second_page, third_page)
+
+
+def render_page(args):
+    '''Draw page n of PAGES and save it on its own to the PDF file at path.
+    Run in a worker process, so everything it needs comes in args.'''
+    n, xy, band_rows, path = args
+    setup_graphs()
+    fig = PAGES[n](xy, band_rows)
+    fig.tight_layout()
+    fig.savefig(path, dpi=DPI)
+    plt.close(fig)
+    return path
+
+
+def main():
+    '''Read the asd files next to this script and write the band plan with
+    their VSWR to canadian_band_plan.pdf.'''
+    # Make a list of the .asd files in current folder and sort them by name.
+    files = sorted(SCRIPT_DIR.glob('*.asd'))
+    xy = read_vswr(files)
+    setup_graphs()
+
+    # Index range of the measurements visible in each band, found in one call.
+    band_rows = np.searchsorted(xy[:, 0], [b['xlim'] for b in BANDS])
+
+    if PdfWriter is not None:
+        # Draw each page in its own process, then merge them in order.
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs = [(n, xy, band_rows, Path(tmp) / f'page{n}.pdf')
+                    for n in range(len(PAGES))]
+            with Pool(len(PAGES)) as pool:
+                paths = pool.map(render_page, jobs)
+            writer = PdfWriter()
+            for path in paths:
+                writer.append(path)
+            writer.compress_identical_objects()   # Fonts shared by pages
+            # Keep the Creator, Producer and CreationDate Matplotlib wrote.
+            writer.add_metadata(PdfReader(paths[0]).metadata)
+            writer.write(output)
+    else:
+        pdf_pages = PdfPages(output)
+        for page in PAGES:
+            fig = page(xy, band_rows)
+            fig.tight_layout()
+            pdf_pages.savefig(fig, dpi=DPI)
+        pdf_pages.close()
+
+
+if __name__ == '__main__':
+    main()